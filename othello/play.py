@@ -6,15 +6,22 @@ Human plays black, bot plays white.
 
 import sys
 import time
-from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from src.board import (
+    Board, get_legal_moves, make_move, pass_turn, is_game_over, get_winner,
+    get_flipped_squares, get_legal_moves_mask, iter_bits, BLACK, WHITE
+)
+from src.engine import OthelloEngine
+from src.evaluate import EvaluationEngine
+from src import ui
 
-from board import Board, get_legal_moves, make_move, pass_turn, is_game_over, get_winner, get_flipped_squares
-from engine import OthelloEngine
-from evaluate import EvaluationEngine
-import ui
+
+# Display names for Board.current_player values
+PLAYER_NAMES = {BLACK: 'Black', WHITE: 'White'}
+
+# Algebraic names for each square index, and the reverse lookup
+SQ_NAMES = tuple(f"{'ABCDEFGH'[sq % 8]}{sq // 8 + 1}" for sq in range(64))
+_NOTATION_TO_SQ = {name: sq for sq, name in enumerate(SQ_NAMES)}
 
 
 def square_to_notation(square: int) -> str:
@@ -26,9 +33,7 @@ def square_to_notation(square: int) -> str:
     Returns:
         Algebraic notation string
     """
-    row = square // 8
-    col = square % 8
-    return f"{chr(ord('A') + col)}{row + 1}"
+    return SQ_NAMES[square]
 
 
 def notation_to_square(notation: str) -> int:
@@ -46,13 +51,10 @@ def notation_to_square(notation: str) -> int:
     if len(notation) != 2:
         raise ValueError("Notation must be 2 characters (e.g., 'D3')")
 
-    col = ord(notation[0].upper()) - ord('A')
-    row = int(notation[1]) - 1
-
-    if not (0 <= col < 8 and 0 <= row < 8):
-        raise ValueError("Invalid square notation")
-
-    return row * 8 + col
+    try:
+        return _NOTATION_TO_SQ[notation.upper()]
+    except KeyError:
+        raise ValueError("Invalid square notation") from None
 
 
 def make_move_with_animation(board: Board, square: int) -> Board:
@@ -89,17 +91,17 @@ def get_human_move(board: Board) -> int:
     Returns:
         Selected square index
     """
-    legal_moves = get_legal_moves(board)
+    legal_mask = get_legal_moves_mask(board)
 
     while True:
         try:
             notation = ui.get_input("\nYour move (e.g., D3):").strip()
             square = notation_to_square(notation)
 
-            if square in legal_moves:
+            if legal_mask & (1 << square):
                 return square
             else:
-                ui.display_message(f"Illegal move! Legal moves: {', '.join(square_to_notation(m) for m in legal_moves)}", "bold red")
+                ui.display_message(f"Illegal move! Legal moves: {', '.join(square_to_notation(m) for m in iter_bits(legal_mask))}", "bold red")
 
         except ValueError as e:
             ui.display_message(f"Invalid input: {e}", "bold red")
@@ -123,8 +125,8 @@ def play_game():
         legal_moves = get_legal_moves(board)
 
         # Display current position
-        ui.display_board(board, legal_moves if board.current_player == 'black' else None,
-                        title=f"Othello - {board.current_player.capitalize()}'s turn")
+        ui.display_board(board, legal_moves if board.current_player == BLACK else None,
+                        title=f"Othello - {PLAYER_NAMES[board.current_player]}'s turn")
 
         # Display score
         ui.display_score(board)
@@ -142,12 +144,12 @@ def play_game():
 
         if not legal_moves:
             # Must pass
-            ui.display_message(f"\n{board.current_player.capitalize()} has no legal moves. Passing...", "bold yellow")
+            ui.display_message(f"\n{PLAYER_NAMES[board.current_player]} has no legal moves. Passing...", "bold yellow")
             board = pass_turn(board)
             time.sleep(1.5)
             continue
 
-        if board.current_player == 'black':
+        if board.current_player == BLACK:
             # Human move
             ui.display_legal_moves(legal_moves, square_to_notation)
             square = get_human_move(board)
@@ -11,8 +11,9 @@ Bitboards use two 64-bit integers to represent black and white pieces.
 Bit N = 1 means a piece exists at square N.
 """
 
-from typing import List, Optional
-from dataclasses import dataclass
+import random
+from typing import Iterator, List, Optional
+from dataclasses import dataclass, field
 
 
 # Constants for board positions (row-major indexing)
@@ -25,6 +26,10 @@ A6, B6, C6, D6, E6, F6, G6, H6 = 40, 41, 42, 43, 44, 45, 46, 47
 A7, B7, C7, D7, E7, F7, G7, H7 = 48, 49, 50, 51, 52, 53, 54, 55
 A8, B8, C8, D8, E8, F8, G8, H8 = 56, 57, 58, 59, 60, 61, 62, 63
 
+# Player identifiers for Board.current_player
+BLACK = 0
+WHITE = 1
+
 # Corner squares (high value in Othello)
 CORNERS = (1 << A1) | (1 << H1) | (1 << A8) | (1 << H8)
 
@@ -37,20 +42,129 @@ DIRECTIONS = [8, 9, 1, -7, -8, -9, -1, 7]
 # Masks to prevent wrapping around board edges
 NOT_A_FILE = 0xFEFEFEFEFEFEFEFE  # All bits except column A
 NOT_H_FILE = 0x7F7F7F7F7F7F7F7F  # All bits except column H
+EDGE_MASK = 0x7E7E7E7E7E7E7E7E   # All bits except columns A and H
+
+# Kogge-Stone fill lanes: (shift amount, mask applied to opponent pieces).
+# Horizontal and diagonal lanes exclude the A/H files to prevent wrapping.
+FILL_LANES = ((1, EDGE_MASK), (8, 0xFFFFFFFFFFFFFFFF), (7, EDGE_MASK), (9, EDGE_MASK))
+
+
+def iter_bits(bb: int) -> Iterator[int]:
+    """Yield indices of set bits in a bitboard, lowest first.
+
+    Runs once per set bit rather than once per square.
+
+    Args:
+        bb: Bitboard
+
+    Yields:
+        Square indices (0-63)
+    """
+    while bb:
+        lsb = bb & -bb
+        yield lsb.bit_length() - 1
+        bb ^= lsb
+
+
+def _build_rays() -> List[List[int]]:
+    """Precompute RAYS[square][direction_index] as bitmasks.
+
+    Each ray holds every square reachable from `square` by repeatedly stepping
+    in DIRECTIONS[direction_index], stopping at the board edge (no wrapping).
+    """
+    rays = [[0] * len(DIRECTIONS) for _ in range(64)]
+    for square in range(64):
+        for d, direction in enumerate(DIRECTIONS):
+            # File step: +1 moves toward H, -1 toward A, 0 stays on the file
+            if direction in (1, 9, -7):
+                file_step = 1
+            elif direction in (-1, -9, 7):
+                file_step = -1
+            else:
+                file_step = 0
+            row_step = (direction - file_step) // 8
+            row, col = divmod(square, 8)
+            row, col = row + row_step, col + file_step
+            while 0 <= row < 8 and 0 <= col < 8:
+                rays[square][d] |= 1 << (row * 8 + col)
+                row, col = row + row_step, col + file_step
+    return rays
+
+
+# RAYS[square][d]: bitmask of squares from `square` outward along DIRECTIONS[d]
+RAYS = _build_rays()
+
+# Per-square rays split by whether they run toward higher or lower squares.
+# Rays shorter than two squares can never bracket a flip and are dropped.
+RAYS_UP = [
+    tuple(ray for d, ray in enumerate(rays) if DIRECTIONS[d] > 0 and ray.bit_count() >= 2)
+    for rays in RAYS
+]
+RAYS_DOWN = [
+    tuple(ray for d, ray in enumerate(rays) if DIRECTIONS[d] < 0 and ray.bit_count() >= 2)
+    for rays in RAYS
+]
+
+# Zobrist keys: ZOBRIST[square][color] for pieces, ZOBRIST_SIDE when white is to move
+# Drawn from a fixed seed so hashes (and any search relying on them) are
+# reproducible across runs
+ZOBRIST_SEED = 0x07E110
+_zobrist_rng = random.Random(ZOBRIST_SEED)
+ZOBRIST = [[_zobrist_rng.getrandbits(64) for _ in range(2)] for _ in range(64)]
+ZOBRIST_SIDE = _zobrist_rng.getrandbits(64)
+del _zobrist_rng
+
+# ZOBRIST_FLIP[square]: combined key for a piece changing color on square
+ZOBRIST_FLIP = [keys[BLACK] ^ keys[WHITE] for keys in ZOBRIST]
+
+
+def compute_zobrist(black_pieces: int, white_pieces: int, current_player: int) -> int:
+    """Compute Zobrist hash of a position from scratch.
 
+    Args:
+        black_pieces: Bitboard of black pieces
+        white_pieces: Bitboard of white pieces
+        current_player: Side to move
+
+    Returns:
+        64-bit hash
+    """
+    h = ZOBRIST_SIDE if current_player == WHITE else 0
+    for square in iter_bits(black_pieces):
+        h ^= ZOBRIST[square][BLACK]
+    for square in iter_bits(white_pieces):
+        h ^= ZOBRIST[square][WHITE]
+    return h
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Board:
     """Othello board state using bitboards.
 
+    Boards are immutable; moves return new boards. The Zobrist hash is
+    computed on construction unless supplied, and make_move/pass_turn
+    update it incrementally. The legal-move mask is computed on first use
+    and cached on the instance.
+
     Attributes:
         black_pieces: 64-bit integer with bits set for black pieces
         white_pieces: 64-bit integer with bits set for white pieces
-        current_player: 'black' or 'white'
+        current_player: BLACK (0) or WHITE (1)
+        zobrist: Zobrist hash of the position
     """
     black_pieces: int
     white_pieces: int
-    current_player: str
+    current_player: int
+    zobrist: Optional[int] = field(default=None, compare=False, repr=False)
+    _legal_mask: Optional[int] = field(default=None, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.zobrist is None:
+            object.__setattr__(self, 'zobrist', compute_zobrist(
+                self.black_pieces, self.white_pieces, self.current_player))
+
+    def __hash__(self) -> int:
+        return self.zobrist
 
     @staticmethod
     def initial() -> 'Board':
@@ -68,11 +182,15 @@ class Board:
         """
         white = (1 << D4) | (1 << E5)  # D4 = 27, E5 = 36
         black = (1 << E4) | (1 << D5)  # E4 = 28, D5 = 35
-        return Board(black, white, 'black')
+        return Board(black, white, BLACK)
 
     def copy(self) -> 'Board':
-        """Create independent copy of this board."""
-        return Board(self.black_pieces, self.white_pieces, self.current_player)
+        """Return a board equal to this one.
+
+        Boards are immutable, so the instance itself is returned (keeping
+        any cached legal moves) instead of allocating a new one.
+        """
+        return self
 
     def get_piece_at(self, square: int) -> Optional[str]:
         """Get piece color at square, or None if empty.
@@ -91,6 +209,96 @@ class Board:
         return None
 
 
+# Slot setters used by _new_board to bypass the frozen dataclass __init__
+_new_instance = object.__new__
+_set_black = Board.black_pieces.__set__
+_set_white = Board.white_pieces.__set__
+_set_player = Board.current_player.__set__
+_set_zobrist = Board.zobrist.__set__
+_set_legal_mask = Board._legal_mask.__set__
+
+
+def _new_board(black_pieces: int, white_pieces: int, current_player: int, zobrist: int) -> Board:
+    """Construct a Board from already-computed fields.
+
+    Writes the slots directly instead of going through the frozen dataclass
+    __init__ (one object.__setattr__ call per field plus __post_init__),
+    roughly halving construction cost on the make_move hot path.
+    """
+    board = _new_instance(Board)
+    _set_black(board, black_pieces)
+    _set_white(board, white_pieces)
+    _set_player(board, current_player)
+    _set_zobrist(board, zobrist)
+    _set_legal_mask(board, None)
+    return board
+
+
+def legal_moves_mask(own: int, opp: int) -> int:
+    """Compute bitmask of legal moves for the side owning `own`.
+
+    Operates on raw bitboards so search and evaluation code can call it
+    without constructing a Board.
+
+    Args:
+        own: Bitboard of the moving player's pieces
+        opp: Bitboard of the opponent's pieces
+
+    Returns:
+        Bitmask of legal move squares
+    """
+    empty = ~(own | opp) & 0xFFFFFFFFFFFFFFFF
+    legal_mask = 0
+
+    # Kogge-Stone fill: each lane handles a shift amount in both directions,
+    # doubling the fill distance per step (1, 2, 4) instead of walking 6 times.
+    for shift, lane_mask in FILL_LANES:
+        pro = opp & lane_mask
+        shift2 = shift << 1
+        shift4 = shift << 2
+
+        # Toward higher squares
+        gen = own | (pro & (own << shift))
+        pro_l = pro & (pro << shift)
+        gen |= pro_l & (gen << shift2)
+        pro_l &= pro_l << shift2
+        gen |= pro_l & (gen << shift4)
+        legal_mask |= ((gen & pro) << shift) & empty
+
+        # Toward lower squares
+        gen = own | (pro & (own >> shift))
+        pro_r = pro & (pro >> shift)
+        gen |= pro_r & (gen >> shift2)
+        pro_r &= pro_r >> shift2
+        gen |= pro_r & (gen >> shift4)
+        legal_mask |= ((gen & pro) >> shift) & empty
+
+    return legal_mask
+
+
+def get_legal_moves_mask(board: Board) -> int:
+    """Get bitmask of legal moves for the current player.
+
+    The mask is computed on first use and cached on the board. Prefer this
+    over get_legal_moves when only emptiness or membership is needed
+    (`mask & (1 << square)`), or iterate it with iter_bits.
+
+    Args:
+        board: Current board state
+
+    Returns:
+        Bitmask of legal move squares
+    """
+    legal_mask = board._legal_mask
+    if legal_mask is None:
+        if board.current_player == BLACK:
+            legal_mask = legal_moves_mask(board.black_pieces, board.white_pieces)
+        else:
+            legal_mask = legal_moves_mask(board.white_pieces, board.black_pieces)
+        object.__setattr__(board, '_legal_mask', legal_mask)
+    return legal_mask
+
+
 def get_legal_moves(board: Board) -> List[int]:
     """Find all legal moves for current player using bitboard operations.
 
@@ -104,56 +312,44 @@ def get_legal_moves(board: Board) -> List[int]:
     Returns:
         List of legal move squares (0-63)
     """
-    if board.current_player == 'black':
-        own = board.black_pieces
-        opp = board.white_pieces
-    else:
-        own = board.white_pieces
-        opp = board.black_pieces
+    return list(iter_bits(get_legal_moves_mask(board)))
 
-    empty = ~(own | opp) & 0xFFFFFFFFFFFFFFFF
-    legal_mask = 0
 
-    # Check each direction
-    for direction in DIRECTIONS:
-        # Get direction-specific mask to prevent wrapping
-        if direction in [1, 9, -7]:  # Moving toward higher files (right)
-            edge_mask = NOT_H_FILE
-        elif direction in [-1, -9, 7]:  # Moving toward lower files (left)
-            edge_mask = NOT_A_FILE
-        else:
-            edge_mask = 0xFFFFFFFFFFFFFFFF
+def flip_mask(own_bits: int, opp_bits: int, square: int) -> int:
+    """Compute bitmask of opponent pieces flipped by placing at square.
 
-        shift = abs(direction)
+    For each direction, the nearest own piece along the precomputed ray bounds
+    the segment to flip; the segment flips only if it is entirely opponent.
 
-        # Find opponent pieces adjacent to own pieces in this direction
-        if direction > 0:
-            candidates = ((own & edge_mask) << shift) & opp
-        else:
-            candidates = ((own & edge_mask) >> shift) & opp
-
-        # Extend along direction while hitting opponent pieces.
-        # Mask before shifting so only pieces that still have neighbors
-        # in this direction can keep moving (prevents wraparound).
-        for _ in range(5):  # Max 6 flips in a row
-            if direction > 0:
-                candidates |= ((candidates & edge_mask) << shift) & opp
-            else:
-                candidates |= ((candidates & edge_mask) >> shift) & opp
+    Args:
+        own_bits: Bitboard of the moving player's pieces
+        opp_bits: Bitboard of the opponent's pieces
+        square: Square to place piece (0-63)
 
-        # One more step to find empty squares beyond opponent pieces
-        if direction > 0:
-            legal_mask |= ((candidates & edge_mask) << shift) & empty
-        else:
-            legal_mask |= ((candidates & edge_mask) >> shift) & empty
+    Returns:
+        Bitmask of squares that would be flipped
+    """
+    flips = 0
+
+    # Rays toward higher squares: nearest own piece is the lowest set bit,
+    # and the segment is every ray square below it
+    for ray in RAYS_UP[square]:
+        blockers = ray & own_bits
+        if blockers:
+            segment = ray & ((blockers & -blockers) - 1)
+            if segment and segment & opp_bits == segment:
+                flips |= segment
 
-    # Convert bitmask to list of square indices
-    moves = []
-    for sq in range(64):
-        if legal_mask & (1 << sq):
-            moves.append(sq)
+    # Rays toward lower squares: nearest own piece is the highest set bit,
+    # and the segment is every ray square above it
+    for ray in RAYS_DOWN[square]:
+        blockers = ray & own_bits
+        if blockers:
+            segment = ray & -(1 << blockers.bit_length())
+            if segment and segment & opp_bits == segment:
+                flips |= segment
 
-    return moves
+    return flips
 
 
 def get_flipped_squares(board: Board, square: int) -> List[int]:
@@ -166,65 +362,12 @@ def get_flipped_squares(board: Board, square: int) -> List[int]:
     Returns:
         List of square indices that would be flipped
     """
-    if board.current_player == 'black':
-        own_bits = board.black_pieces
-        opp_bits = board.white_pieces
+    if board.current_player == BLACK:
+        flips = flip_mask(board.black_pieces, board.white_pieces, square)
     else:
-        own_bits = board.white_pieces
-        opp_bits = board.black_pieces
-
-    flips = 0
-
-    # Check each direction for pieces to flip
-    for direction in DIRECTIONS:
-        # Get direction-specific mask
-        if direction in [1, 9, -7]:
-            edge_mask = NOT_H_FILE
-        elif direction in [-1, -9, 7]:
-            edge_mask = NOT_A_FILE
-        else:
-            edge_mask = 0xFFFFFFFFFFFFFFFF
-
-        # Walk in direction to find pieces to flip
-        candidates = 0
-        pos = square
-
-        for _ in range(6):
-            if direction > 0:
-                pos += direction
-                if pos >= 64:
-                    break
-                # Check if we wrapped around an edge
-                if direction in [1, 9, -7] and (1 << pos) & ~edge_mask:
-                    break
-                if direction in [-1, -9, 7] and (1 << square) & ~edge_mask:
-                    break
-            else:
-                pos -= -direction
-                if pos < 0:
-                    break
-                if direction in [1, 9, -7] and (1 << square) & ~edge_mask:
-                    break
-                if direction in [-1, -9, 7] and (1 << pos) & ~edge_mask:
-                    break
-
-            pos_bit = 1 << pos
-
-            if pos_bit & opp_bits:
-                candidates |= pos_bit
-            elif pos_bit & own_bits:
-                flips |= candidates
-                break
-            else:
-                break
+        flips = flip_mask(board.white_pieces, board.black_pieces, square)
 
-    # Convert bitmask to list of square indices
-    flipped = []
-    for sq in range(64):
-        if flips & (1 << sq):
-            flipped.append(sq)
-
-    return flipped
+    return list(iter_bits(flips))
 
 
 def make_move(board: Board, square: int) -> Board:
@@ -240,76 +383,31 @@ def make_move(board: Board, square: int) -> Board:
     Returns:
         New board state after move
     """
-    new_board = board.copy()
-
-    if new_board.current_player == 'black':
-        own_bits = new_board.black_pieces
-        opp_bits = new_board.white_pieces
+    player = board.current_player
+    if player == BLACK:
+        own_bits = board.black_pieces
+        opp_bits = board.white_pieces
     else:
-        own_bits = new_board.white_pieces
-        opp_bits = new_board.black_pieces
+        own_bits = board.white_pieces
+        opp_bits = board.black_pieces
 
     placed = 1 << square
-    flips = 0
+    flips = flip_mask(own_bits, opp_bits, square)
 
-    # Check each direction for pieces to flip
-    for direction in DIRECTIONS:
-        # Get direction-specific mask
-        if direction in [1, 9, -7]:
-            edge_mask = NOT_H_FILE
-        elif direction in [-1, -9, 7]:
-            edge_mask = NOT_A_FILE
-        else:
-            edge_mask = 0xFFFFFFFFFFFFFFFF
-
-        # Walk in direction to find pieces to flip
-        candidates = 0
-        pos = square
-
-        for _ in range(6):
-            if direction > 0:
-                pos += direction
-                if pos >= 64:
-                    break
-                # Check if we wrapped around an edge
-                if direction in [1, 9, -7] and (1 << pos) & ~edge_mask:
-                    break
-                if direction in [-1, -9, 7] and (1 << square) & ~edge_mask:
-                    break
-            else:
-                pos -= -direction
-                if pos < 0:
-                    break
-                if direction in [1, 9, -7] and (1 << square) & ~edge_mask:
-                    break
-                if direction in [-1, -9, 7] and (1 << pos) & ~edge_mask:
-                    break
-
-            pos_bit = 1 << pos
-
-            if pos_bit & opp_bits:
-                candidates |= pos_bit
-            elif pos_bit & own_bits:
-                flips |= candidates
-                break
-            else:
-                break
+    # Update hash: placed piece, side to move, and each flipped piece
+    zobrist = board.zobrist ^ ZOBRIST[square][player] ^ ZOBRIST_SIDE
+    bb = flips
+    while bb:
+        zobrist ^= ZOBRIST_FLIP[(bb & -bb).bit_length() - 1]
+        bb &= bb - 1
 
     # Apply flips
     own_bits |= placed | flips
     opp_bits &= ~flips
 
-    # Update board
-    if new_board.current_player == 'black':
-        new_board.black_pieces = own_bits
-        new_board.white_pieces = opp_bits
-        new_board.current_player = 'white'
-    else:
-        new_board.white_pieces = own_bits
-        new_board.black_pieces = opp_bits
-        new_board.current_player = 'black'
-
-    return new_board
+    if player == BLACK:
+        return _new_board(own_bits, opp_bits, WHITE, zobrist)
+    return _new_board(opp_bits, own_bits, BLACK, zobrist)
 
 
 def pass_turn(board: Board) -> Board:
@@ -321,9 +419,8 @@ def pass_turn(board: Board) -> Board:
     Returns:
         New board with player switched
     """
-    new_board = board.copy()
-    new_board.current_player = 'white' if board.current_player == 'black' else 'black'
-    return new_board
+    return _new_board(board.black_pieces, board.white_pieces, board.current_player ^ 1,
+                      board.zobrist ^ ZOBRIST_SIDE)
 
 
 def is_game_over(board: Board) -> bool:
@@ -335,12 +432,11 @@ def is_game_over(board: Board) -> bool:
     Returns:
         True if game is over
     """
-    if get_legal_moves(board):
+    if get_legal_moves_mask(board):
         return False
 
     # Current player has no moves; check if opponent has any
-    opponent_board = pass_turn(board)
-    return len(get_legal_moves(opponent_board)) == 0
+    return get_legal_moves_mask(pass_turn(board)) == 0
 
 
 def get_winner(board: Board) -> Optional[str]:
@@ -352,8 +448,8 @@ def get_winner(board: Board) -> Optional[str]:
     Returns:
         'black', 'white', or None for tie
     """
-    black_count = bin(board.black_pieces).count('1')
-    white_count = bin(board.white_pieces).count('1')
+    black_count = board.black_pieces.bit_count()
+    white_count = board.white_pieces.bit_count()
 
     if black_count > white_count:
         return 'black'
@@ -363,6 +459,95 @@ def get_winner(board: Board) -> Optional[str]:
         return None
 
 
+# Board symmetries (the 8 elements of D4), encoded as 3 bits applied in order:
+# bit 0 mirrors files (A<->H), bit 1 flips ranks (1<->8), bit 2 transposes
+# along the A1-H8 diagonal. SYMMETRY_IDENTITY leaves the board unchanged.
+SYMMETRY_IDENTITY = 0
+SYMMETRY_COUNT = 8
+
+
+def mirror_horizontal(bb: int) -> int:
+    """Mirror a bitboard left-right (file A <-> file H)."""
+    bb = ((bb >> 1) & 0x5555555555555555) | ((bb & 0x5555555555555555) << 1)
+    bb = ((bb >> 2) & 0x3333333333333333) | ((bb & 0x3333333333333333) << 2)
+    return ((bb >> 4) & 0x0F0F0F0F0F0F0F0F) | ((bb & 0x0F0F0F0F0F0F0F0F) << 4)
+
+
+def flip_vertical(bb: int) -> int:
+    """Flip a bitboard top-bottom (rank 1 <-> rank 8)."""
+    return int.from_bytes(bb.to_bytes(8, 'little'), 'big')
+
+
+def flip_diagonal(bb: int) -> int:
+    """Transpose a bitboard along the A1-H8 diagonal (square (r, c) -> (c, r))."""
+    t = 0x0F0F0F0F00000000 & (bb ^ (bb << 28))
+    bb ^= t ^ (t >> 28)
+    t = 0x3333000033330000 & (bb ^ (bb << 14))
+    bb ^= t ^ (t >> 14)
+    t = 0x5500550055005500 & (bb ^ (bb << 7))
+    return bb ^ t ^ (t >> 7)
+
+
+def transform_bitboard(bb: int, symmetry: int) -> int:
+    """Apply a board symmetry to a bitboard.
+
+    Args:
+        bb: Bitboard
+        symmetry: Symmetry index (0-7)
+
+    Returns:
+        Transformed bitboard
+    """
+    if symmetry & 1:
+        bb = mirror_horizontal(bb)
+    if symmetry & 2:
+        bb = flip_vertical(bb)
+    if symmetry & 4:
+        bb = flip_diagonal(bb)
+    return bb
+
+
+def transform_square(square: int, symmetry: int) -> int:
+    """Map a square through a board symmetry (same order as transform_bitboard)."""
+    row, col = divmod(square, 8)
+    if symmetry & 1:
+        col = 7 - col
+    if symmetry & 2:
+        row = 7 - row
+    if symmetry & 4:
+        row, col = col, row
+    return row * 8 + col
+
+
+def untransform_square(square: int, symmetry: int) -> int:
+    """Map a square from a transformed board back to the original board."""
+    row, col = divmod(square, 8)
+    if symmetry & 4:
+        row, col = col, row
+    if symmetry & 2:
+        row = 7 - row
+    if symmetry & 1:
+        col = 7 - col
+    return row * 8 + col
+
+
+def transform_board(board: Board, symmetry: int) -> Board:
+    """Apply a board symmetry to a position (side to move is unchanged).
+
+    Args:
+        board: Board state
+        symmetry: Symmetry index (0-7)
+
+    Returns:
+        Transformed board with its own Zobrist hash
+    """
+    return Board(
+        transform_bitboard(board.black_pieces, symmetry),
+        transform_bitboard(board.white_pieces, symmetry),
+        board.current_player
+    )
+
+
 def board_to_string(board: Board) -> str:
     """Convert board to human-readable string.
 
@@ -372,17 +557,13 @@ def board_to_string(board: Board) -> str:
     Returns:
         Multi-line string representation
     """
+    chars = ['.'] * 64
+    for sq in iter_bits(board.black_pieces):
+        chars[sq] = 'B'
+    for sq in iter_bits(board.white_pieces):
+        chars[sq] = 'W'
+
     lines = ['  A B C D E F G H']
     for row in range(8):
-        line = f'{row + 1} '
-        for col in range(8):
-            sq = row * 8 + col
-            piece = board.get_piece_at(sq)
-            if piece == 'black':
-                line += 'B '
-            elif piece == 'white':
-                line += 'W '
-            else:
-                line += '. '
-        lines.append(line)
+        lines.append(f'{row + 1} ' + ' '.join(chars[row * 8:row * 8 + 8]) + ' ')
     return '\n'.join(lines)
@@ -6,8 +6,14 @@ Features aspiration windows, iterative deepening, killer moves, and history heur
 
 import time
 from typing import Optional, Tuple
-from board import Board, get_legal_moves
-from search import negamax, TranspositionTable, KillerMoves, HistoryTable
+from .board import (
+    Board, get_legal_moves_mask, transform_board, untransform_square,
+    SYMMETRY_COUNT, SYMMETRY_IDENTITY
+)
+from .search import (
+    negamax, new_tt, tt_clear, tt_probe, SearchLimit,
+    TranspositionTable, KillerMoves, HistoryTable, NEG_INF, POS_INF
+)
 
 
 class OthelloEngine:
@@ -25,7 +31,7 @@ class OthelloEngine:
 
     def __init__(self):
         """Initialize the engine."""
-        self.tt: TranspositionTable = {}
+        self.tt: TranspositionTable = new_tt()
         self.killer_moves: KillerMoves = {}
         self.history: HistoryTable = {}
         self.nodes_searched = 0
@@ -52,40 +58,51 @@ class OthelloEngine:
         self.max_depth_reached = 0
 
         # Get legal moves
-        moves = get_legal_moves(board)
-        if not moves:
+        legal_mask = get_legal_moves_mask(board)
+        if not legal_mask:
             return None, 0.0, 0
 
-        # If only one move, return immediately
-        if len(moves) == 1:
-            self.pv_move = moves[0]
-            return moves[0], 0.0, 0
-
-        # Iterative deepening with aspiration windows
-        start_time = time.time()
-        best_move = moves[0]
+        # If only one move (single bit set), return immediately
+        if legal_mask & (legal_mask - 1) == 0:
+            self.pv_move = legal_mask.bit_length() - 1
+            return self.pv_move, 0.0, 0
+
+        # Seed the PV move from the transposition table: this position was
+        # usually searched as part of the previous move's tree. A PV move left
+        # over from a different position would only mislead root ordering.
+        self.pv_move = self._find_tt_move(board, legal_mask)
+
+        # Iterative deepening with aspiration windows. The deadline uses the
+        # monotonic clock and is enforced inside the search as well.
+        deadline = time.monotonic() + time_limit_seconds
+        limit = SearchLimit(deadline)
+        if self.pv_move is not None:
+            best_move = self.pv_move
+        else:
+            best_move = (legal_mask & -legal_mask).bit_length() - 1
         best_score = 0.0
         depth = 1
 
-        # Clear tables for new search (but keep history across moves for learning)
-        self.tt.clear()
+        # Clear killers for new search. The transposition table is keyed by
+        # Zobrist hash and bounded in size, so it is kept across moves;
+        # history also accumulates learning.
         self.killer_moves.clear()
-        # Don't clear history - it accumulates learning
 
-        # Aspiration window size
+        # Aspiration window size, and the widening step beyond which a
+        # failing side of the window is opened completely
         ASPIRATION_WINDOW = 50.0
+        ASPIRATION_MAX_DELTA = 1000.0
 
         while True:
             # Check time limit
-            elapsed = time.time() - start_time
-            if elapsed >= time_limit_seconds and depth > 1:
+            if time.monotonic() >= deadline and depth > 1:
                 break
 
             # Set aspiration window
             if depth <= 2:
                 # Use full window for shallow searches
-                alpha = float('-inf')
-                beta = float('inf')
+                alpha = NEG_INF
+                beta = POS_INF
             else:
                 # Use narrow window based on previous score
                 alpha = best_score - ASPIRATION_WINDOW
@@ -93,62 +110,47 @@ class OthelloEngine:
 
             # Search at current depth with aspiration window
             try:
-                score, move = negamax(
-                    board,
-                    depth,
-                    alpha,
-                    beta,
-                    board.current_player,
-                    self.tt,
-                    self.killer_moves,
-                    self.history,
-                    self.pv_move,
-                    0
-                )
-
-                # Check if we failed outside the window
-                if score <= alpha:
-                    # Failed low - research with lower bound
-                    score, move = negamax(
-                        board,
-                        depth,
-                        float('-inf'),
-                        beta,
-                        board.current_player,
-                        self.tt,
-                        self.killer_moves,
-                        self.history,
-                        self.pv_move,
-                        0
-                    )
-                elif score >= beta:
-                    # Failed high - research with upper bound
+                delta = ASPIRATION_WINDOW
+                while True:
                     score, move = negamax(
                         board,
                         depth,
                         alpha,
-                        float('inf'),
+                        beta,
                         board.current_player,
                         self.tt,
                         self.killer_moves,
                         self.history,
                         self.pv_move,
-                        0
+                        0,
+                        limit
                     )
 
+                    # On failure, widen only the failing side (x4 per retry) so
+                    # re-searches stay narrow and reuse the TT from the failed one
+                    if score <= alpha and alpha > NEG_INF:
+                        alpha = alpha - delta if delta < ASPIRATION_MAX_DELTA else NEG_INF
+                    elif score >= beta and beta < POS_INF:
+                        beta = beta + delta if delta < ASPIRATION_MAX_DELTA else POS_INF
+                    else:
+                        break
+                    delta *= 4
+
                 if move is not None:
                     best_move = move
                     best_score = score
                     self.pv_move = move  # Store for next iteration
                     self.max_depth_reached = depth
 
+            except TimeoutError:
+                # Deadline hit mid-search: keep the last completed depth
+                break
             except KeyboardInterrupt:
                 # Allow graceful interruption
                 break
 
             # Check time again before incrementing depth
-            elapsed = time.time() - start_time
-            if elapsed >= time_limit_seconds:
+            if time.monotonic() >= deadline:
                 break
 
             # Increase depth for next iteration
@@ -158,11 +160,39 @@ class OthelloEngine:
             if depth > 50:
                 break
 
+        self.nodes_searched = limit.nodes
         return best_move, best_score, self.max_depth_reached
 
+    def _find_tt_move(self, board: Board, legal_mask: int) -> Optional[int]:
+        """Look up a stored best move for board or any symmetric equivalent.
+
+        Mirror/rotation-equivalent positions (common in the opening) share
+        their stored move: it is mapped back through the symmetry used.
+        Only done once per root, so the per-node TT keys stay incremental.
+
+        Args:
+            board: Root board
+            legal_mask: Legal-move mask of board
+
+        Returns:
+            A legal move from the TT, or None
+        """
+        for symmetry in range(SYMMETRY_COUNT):
+            if symmetry == SYMMETRY_IDENTITY:
+                key = board.zobrist
+            else:
+                key = transform_board(board, symmetry).zobrist
+            entry = tt_probe(self.tt, key)
+            if entry is None or entry.best_move is None:
+                continue
+            move = untransform_square(entry.best_move, symmetry)
+            if legal_mask >> move & 1:
+                return move
+        return None
+
     def reset(self):
         """Reset engine state (clear all tables except history)."""
-        self.tt.clear()
+        tt_clear(self.tt)
         self.killer_moves.clear()
         # Keep history for learning across games
         self.nodes_searched = 0
@@ -7,7 +7,26 @@ raw scores into user-friendly predictions for the CLI.
 
 import math
 from dataclasses import dataclass
-from board import Board, get_legal_moves, CORNERS, X_SQUARES, DIRECTIONS, NOT_A_FILE, NOT_H_FILE
+from itertools import product
+from typing import List
+from .board import Board, iter_bits, legal_moves_mask, WHITE, CORNERS, X_SQUARES, NOT_A_FILE, NOT_H_FILE
+
+__all__ = [
+    'evaluate',
+    'clear_eval_cache',
+    'evaluate_terminal',
+    'count_stable_pieces',
+    'count_frontier_pieces',
+    'get_frontier_squares',
+    'get_positional_value',
+    'get_parity_bonus',
+    'get_smart_x_square_penalty',
+    'EvaluationSummary',
+    'EvaluationEngine',
+]
+
+# Hardware popcount on native ints (Python 3.10+); bound once to skip method lookup
+_popcount = int.bit_count
 
 
 # TUNABLE: Evaluation weights (rebalanced for advanced features)
@@ -34,8 +53,19 @@ POSITION_WEIGHTS = [
     120,  -20,   20,   10,   10,   20,  -20,  120,  # Row 8
 ]
 
+# ROW_WEIGHTS[row][byte]: summed POSITION_WEIGHTS of the squares set in one
+# row's 8-bit occupancy pattern (bit 0 = file A)
+ROW_WEIGHTS = tuple(
+    tuple(
+        float(sum(POSITION_WEIGHTS[row * 8 + col] for col in range(8) if pattern >> col & 1))
+        for pattern in range(256)
+    )
+    for row in range(8)
+)
+_ROW1, _ROW2, _ROW3, _ROW4, _ROW5, _ROW6, _ROW7, _ROW8 = ROW_WEIGHTS
 
-def count_stable_pieces(board: Board, player_pieces: int, opponent_pieces: int) -> int:
+
+def count_stable_pieces(player_pieces: int, opponent_pieces: int) -> int:
     """Count pieces that can never be flipped (stability analysis).
 
     A piece is stable if it cannot be flipped for the rest of the game.
@@ -45,54 +75,59 @@ def count_stable_pieces(board: Board, player_pieces: int, opponent_pieces: int)
     3. Pieces completely surrounded by stable pieces
 
     Args:
-        board: Current board state
         player_pieces: Bitboard of player's pieces
         opponent_pieces: Bitboard of opponent's pieces
 
     Returns:
         Number of stable pieces
     """
-    occupied = player_pieces | opponent_pieces
-    stable = 0
-
-    # Start with corners owned by player
+    # Start with corners owned by player; without one nothing is stable
     stable_mask = player_pieces & CORNERS
+    if not stable_mask:
+        return 0
 
     # Iteratively expand stable region
     # A piece is stable if it's connected to stable pieces in all attack directions
-    changed = True
-    iterations = 0
-    while changed and iterations < 10:  # Limit iterations for performance
-        changed = False
-        old_stable = stable_mask
-        iterations += 1
-
-        # Check all 8 directions
-        for direction in DIRECTIONS:
-            shift = abs(direction)
-
-            # Get edge mask for this direction
-            if direction in [1, 9, -7]:  # Right
-                edge_mask = NOT_H_FILE
-            elif direction in [-1, -9, 7]:  # Left
-                edge_mask = NOT_A_FILE
-            else:
-                edge_mask = 0xFFFFFFFFFFFFFFFF
-
-            # Expand stable region in this direction
-            if direction > 0:
-                new_stable = ((stable_mask & edge_mask) << shift) & player_pieces
-            else:
-                new_stable = ((stable_mask & edge_mask) >> shift) & player_pieces
+    # Each pass steps through the 8 directions in DIRECTIONS order, each
+    # shift building on the last; passes are capped at 10 for performance
+    p = player_pieces
+    for _ in range(10):
+        sm = stable_mask
+        stable_mask |= (stable_mask << 8) & p
+        stable_mask |= ((stable_mask & NOT_H_FILE) << 9) & p
+        stable_mask |= ((stable_mask & NOT_H_FILE) << 1) & p
+        stable_mask |= ((stable_mask & NOT_H_FILE) >> 7) & p
+        stable_mask |= (stable_mask >> 8) & p
+        stable_mask |= ((stable_mask & NOT_A_FILE) >> 9) & p
+        stable_mask |= ((stable_mask & NOT_A_FILE) >> 1) & p
+        stable_mask |= ((stable_mask & NOT_A_FILE) << 7) & p
+        if stable_mask == sm:
+            break
+
+    return _popcount(stable_mask)
+
+
+def get_frontier_squares(occupied: int) -> int:
+    """Get occupied squares with at least one empty neighbor.
+
+    All 8 directions are shifted in one expression on the empty set; the
+    result covers both sides, so one call serves both frontier counts.
 
-            # Also check if piece is on edge and anchored
-            # Pieces on edges are stable if all squares from corner to them are filled
-            stable_mask |= new_stable
+    Args:
+        occupied: Bitboard of all pieces
 
-        if stable_mask != old_stable:
-            changed = True
+    Returns:
+        Bitboard of frontier squares (either color)
+    """
+    empty = ~occupied & 0xFFFFFFFFFFFFFFFF
 
-    return bin(stable_mask).count('1')
+    # Edge masks clear bits that wrapped across the A/H files
+    return (
+        ((empty << 1) & NOT_A_FILE) | ((empty >> 1) & NOT_H_FILE)
+        | (empty << 8) | (empty >> 8)
+        | ((empty << 9) & NOT_A_FILE) | ((empty >> 9) & NOT_H_FILE)
+        | ((empty << 7) & NOT_H_FILE) | ((empty >> 7) & NOT_A_FILE)
+    ) & occupied
 
 
 def count_frontier_pieces(player_pieces: int, opponent_pieces: int) -> int:
@@ -107,35 +142,15 @@ def count_frontier_pieces(player_pieces: int, opponent_pieces: int) -> int:
     Returns:
         Number of frontier pieces
     """
-    occupied = player_pieces | opponent_pieces
-    empty = ~occupied & 0xFFFFFFFFFFFFFFFF
-
-    frontier = 0
-
-    # Check each direction for empty neighbors
-    for direction in DIRECTIONS:
-        shift = abs(direction)
-
-        # Get edge mask
-        if direction in [1, 9, -7]:
-            edge_mask = NOT_H_FILE
-        elif direction in [-1, -9, 7]:
-            edge_mask = NOT_A_FILE
-        else:
-            edge_mask = 0xFFFFFFFFFFFFFFFF
-
-        # Find player pieces with empty neighbors in this direction
-        if direction > 0:
-            frontier |= ((empty & edge_mask) >> shift) & player_pieces
-        else:
-            frontier |= ((empty & edge_mask) << shift) & player_pieces
-
-    return bin(frontier).count('1')
+    return _popcount(get_frontier_squares(player_pieces | opponent_pieces) & player_pieces)
 
 
 def get_positional_value(player_pieces: int, opponent_pieces: int) -> float:
     """Calculate positional value based on piece locations.
 
+    Sums 8 row-table lookups per side (one per byte of the bitboard)
+    instead of testing all 64 squares.
+
     Args:
         player_pieces: Bitboard of player's pieces
         opponent_pieces: Bitboard of opponent's pieces
@@ -143,22 +158,15 @@ def get_positional_value(player_pieces: int, opponent_pieces: int) -> float:
     Returns:
         Positional score difference (player - opponent)
     """
-    player_value = 0.0
-    opponent_value = 0.0
-
-    for square in range(64):
-        mask = 1 << square
-        weight = POSITION_WEIGHTS[square]
+    p = player_pieces.to_bytes(8, 'little')
+    o = opponent_pieces.to_bytes(8, 'little')
+    return (_ROW1[p[0]] + _ROW2[p[1]] + _ROW3[p[2]] + _ROW4[p[3]]
+            + _ROW5[p[4]] + _ROW6[p[5]] + _ROW7[p[6]] + _ROW8[p[7]]
+            - _ROW1[o[0]] - _ROW2[o[1]] - _ROW3[o[2]] - _ROW4[o[3]]
+            - _ROW5[o[4]] - _ROW6[o[5]] - _ROW7[o[6]] - _ROW8[o[7]])
 
-        if player_pieces & mask:
-            player_value += weight
-        elif opponent_pieces & mask:
-            opponent_value += weight
 
-    return player_value - opponent_value
-
-
-def get_parity_bonus(board: Board, player: str) -> float:
+def get_parity_bonus(board: Board, player: int) -> float:
     """Calculate parity bonus in endgame.
 
     In endgame, the player who makes the last move in a region has an advantage.
@@ -172,7 +180,7 @@ def get_parity_bonus(board: Board, player: str) -> float:
         Parity bonus
     """
     occupied = board.black_pieces | board.white_pieces
-    empty_count = 64 - bin(occupied).count('1')
+    empty_count = 64 - _popcount(occupied)
 
     # Only apply in endgame (less than 20 empty squares)
     if empty_count >= 20:
@@ -188,144 +196,162 @@ def get_parity_bonus(board: Board, player: str) -> float:
         return -parity * PARITY_WEIGHT
 
 
-def is_corner_empty(corner_square: int, board: Board) -> bool:
-    """Check if a corner square is empty.
-
-    Args:
-        corner_square: Corner square index
-        board: Current board state
-
-    Returns:
-        True if corner is empty
-    """
-    occupied = board.black_pieces | board.white_pieces
-    return not (occupied & (1 << corner_square))
+# Map X-squares to their adjacent corners
+# B2 (9) -> A1 (0), G2 (14) -> H1 (7)
+# B7 (49) -> A8 (56), G7 (54) -> H8 (63)
+X_TO_CORNER = ((9, 0), (14, 7), (49, 56), (54, 63))
 
 
-def get_smart_x_square_penalty(board: Board, player_pieces: int) -> float:
+def get_smart_x_square_penalty(player_pieces: int, occupied: int) -> float:
     """Calculate X-square penalty only when adjacent corner is empty.
 
     X-squares are only bad if they give opponent access to the corner.
 
     Args:
-        board: Current board state
         player_pieces: Bitboard of player's pieces
+        occupied: Bitboard of all pieces
 
     Returns:
         X-square penalty
     """
     penalty = 0.0
-
-    # Map X-squares to their adjacent corners
-    # B2 (9) -> A1 (0), G2 (14) -> H1 (7)
-    # B7 (49) -> A8 (56), G7 (54) -> H8 (63)
-    x_to_corner = {
-        9: 0,    # B2 -> A1
-        14: 7,   # G2 -> H1
-        49: 56,  # B7 -> A8
-        54: 63,  # G7 -> H8
-    }
-
-    for x_square, corner in x_to_corner.items():
+    for x_square, corner in X_TO_CORNER:
         # If player has X-square AND corner is empty, apply penalty
-        if (player_pieces & (1 << x_square)) and is_corner_empty(corner, board):
+        if player_pieces >> x_square & 1 and not occupied >> corner & 1:
             penalty += X_SQUARE_PENALTY
-
     return penalty
 
 
-def evaluate(board: Board, player: str) -> float:
+def _build_corner_x_table() -> dict:
+    """Precompute corner bonus + X-square penalty for every corner/X-square layout.
+
+    Keyed by (own & CORNER_X_MASK) | ((opp & CORNER_X_MASK) << 1): the
+    shifted opponent bits never land on a corner or X-square, so the two
+    sides cannot collide.
+    """
+    squares = list(iter_bits(CORNER_X_MASK))
+    table = {}
+    for layout in product((0, 1, 2), repeat=len(squares)):
+        own = opp = 0
+        for square, owner in zip(squares, layout):
+            if owner == 1:
+                own |= 1 << square
+            elif owner == 2:
+                opp |= 1 << square
+        occupied = own | opp
+        corner_diff = _popcount(own & CORNERS) - _popcount(opp & CORNERS)
+        table[own | (opp << 1)] = (
+            corner_diff * CORNER_WEIGHT
+            + get_smart_x_square_penalty(own, occupied)
+            - get_smart_x_square_penalty(opp, occupied)
+        )
+    return table
+
+
+# The 8 squares that decide the corner and X-square terms
+CORNER_X_MASK = CORNERS | X_SQUARES
+CORNER_X_TABLE = _build_corner_x_table()
+
+
+# Evaluations cached per (Zobrist key, player), direct-mapped like the TT:
+# slot i holds the key and score of the last position that indexed it
+EVAL_CACHE_SIZE = 1 << 18
+EVAL_CACHE_MASK = EVAL_CACHE_SIZE - 1
+_eval_keys: List[int] = [-1] * EVAL_CACHE_SIZE
+_eval_scores: List[float] = [0.0] * EVAL_CACHE_SIZE
+
+
+def clear_eval_cache() -> None:
+    """Forget every cached evaluation (e.g. after changing the weights)."""
+    _eval_keys[:] = [-1] * EVAL_CACHE_SIZE
+
+
+def evaluate(board: Board, player: int) -> float:
     """Evaluate board position from perspective of given player.
 
-    Uses advanced heuristics:
+    Uses advanced heuristics, cheapest first:
     - Mobility (legal moves)
+    - Positional weights (some squares are better)
+    - Corner control and smart X-square penalty (context-aware)
+    - Piece count (endgame tiebreaker)
     - Stability (pieces that can't be flipped)
     - Frontier (pieces with empty neighbors)
-    - Positional weights (some squares are better)
-    - Corner control
-    - Smart X-square penalty (context-aware)
     - Parity (endgame advantage)
-    - Piece count (endgame tiebreaker)
 
     Positive score = good for player
     Negative score = bad for player
 
     Args:
         board: Current board state
-        player: Player to evaluate for ('black' or 'white')
+        player: Player to evaluate for (BLACK or WHITE)
 
     Returns:
         Evaluation score as float
     """
+    key = board.zobrist << 1 | player
+    index = key & EVAL_CACHE_MASK
+    if _eval_keys[index] == key:
+        return _eval_scores[index]
+
+    score = _evaluate(board, player)
+    _eval_keys[index] = key
+    _eval_scores[index] = score
+    return score
+
+
+def _evaluate(board: Board, player: int) -> float:
+    """Uncached body of evaluate."""
     score = 0.0
 
-    # Determine player and opponent pieces
-    if player == 'black':
-        own_pieces = board.black_pieces
-        opp_pieces = board.white_pieces
-    else:
-        own_pieces = board.white_pieces
-        opp_pieces = board.black_pieces
+    # Determine player and opponent pieces (BLACK/WHITE index the pair)
+    pieces = (board.black_pieces, board.white_pieces)
+    own_pieces = pieces[player]
+    opp_pieces = pieces[player ^ 1]
 
     # --- MOBILITY: Number of legal moves ---
     # More moves = more options = better position
-    own_board = Board(
-        black_pieces=board.black_pieces,
-        white_pieces=board.white_pieces,
-        current_player=player
-    )
-    own_mobility = len(get_legal_moves(own_board))
-
-    opponent = 'white' if player == 'black' else 'black'
-    opp_board = Board(
-        black_pieces=board.black_pieces,
-        white_pieces=board.white_pieces,
-        current_player=opponent
-    )
-    opp_mobility = len(get_legal_moves(opp_board))
+    # (counted straight from the bitboards, no Board per side to move)
+    own_mobility = _popcount(legal_moves_mask(own_pieces, opp_pieces))
+    opp_mobility = _popcount(legal_moves_mask(opp_pieces, own_pieces))
 
     score += (own_mobility - opp_mobility) * MOBILITY_WEIGHT
 
-    # --- STABILITY: Pieces that can never be flipped ---
-    # Stable pieces are extremely valuable
-    own_stable = count_stable_pieces(board, own_pieces, opp_pieces)
-    opp_stable = count_stable_pieces(board, opp_pieces, own_pieces)
-    score += (own_stable - opp_stable) * STABILITY_WEIGHT
-
-    # --- FRONTIER: Pieces with empty neighbors ---
-    # Frontier pieces are vulnerable - fewer is better
-    own_frontier = count_frontier_pieces(own_pieces, opp_pieces)
-    opp_frontier = count_frontier_pieces(opp_pieces, own_pieces)
-    score += (own_frontier - opp_frontier) * FRONTIER_WEIGHT
-
     # --- POSITIONAL WEIGHTS: Some squares are inherently better ---
     position_value = get_positional_value(own_pieces, opp_pieces)
     score += position_value * POSITION_WEIGHT_SCALE
 
     # --- CORNERS: Included in positional weights, but corners are so important
     # they get double-counted here for extra emphasis
-    own_corners = bin(own_pieces & CORNERS).count('1')
-    opp_corners = bin(opp_pieces & CORNERS).count('1')
-    score += (own_corners - opp_corners) * CORNER_WEIGHT
-
     # --- SMART X-SQUARES: Only penalize if adjacent corner is empty ---
-    own_x_penalty = get_smart_x_square_penalty(board, own_pieces)
-    opp_x_penalty = get_smart_x_square_penalty(board, opp_pieces)
-    score += own_x_penalty - opp_x_penalty
+    # (both terms in one lookup on the 8 corner/X-square bits of each side)
+    score += CORNER_X_TABLE[(own_pieces & CORNER_X_MASK) | ((opp_pieces & CORNER_X_MASK) << 1)]
+
+    # --- PIECE COUNT: Total pieces (matters in endgame) ---
+    own_count = _popcount(own_pieces)
+    opp_count = _popcount(opp_pieces)
+    score += (own_count - opp_count) * PIECE_COUNT_WEIGHT
+
+    # --- STABILITY: Pieces that can never be flipped ---
+    # Stable pieces are extremely valuable
+    own_stable = count_stable_pieces(own_pieces, opp_pieces)
+    opp_stable = count_stable_pieces(opp_pieces, own_pieces)
+    score += (own_stable - opp_stable) * STABILITY_WEIGHT
+
+    # --- FRONTIER: Pieces with empty neighbors ---
+    # Frontier pieces are vulnerable - fewer is better
+    frontier = get_frontier_squares(own_pieces | opp_pieces)
+    own_frontier = _popcount(frontier & own_pieces)
+    opp_frontier = _popcount(frontier & opp_pieces)
+    score += (own_frontier - opp_frontier) * FRONTIER_WEIGHT
 
     # --- PARITY: Endgame advantage for last move ---
     parity_bonus = get_parity_bonus(board, player)
     score += parity_bonus
 
-    # --- PIECE COUNT: Total pieces (matters in endgame) ---
-    own_count = bin(own_pieces).count('1')
-    opp_count = bin(opp_pieces).count('1')
-    score += (own_count - opp_count) * PIECE_COUNT_WEIGHT
-
     return score
 
 
-def evaluate_terminal(board: Board, player: str) -> float:
+def evaluate_terminal(board: Board, player: int) -> float:
     """Evaluate terminal (game over) position.
 
     Returns large positive/negative scores for wins/losses.
@@ -337,12 +363,9 @@ def evaluate_terminal(board: Board, player: str) -> float:
     Returns:
         +inf for win, -inf for loss, 0 for tie
     """
-    if player == 'black':
-        own_count = bin(board.black_pieces).count('1')
-        opp_count = bin(board.white_pieces).count('1')
-    else:
-        own_count = bin(board.white_pieces).count('1')
-        opp_count = bin(board.black_pieces).count('1')
+    pieces = (board.black_pieces, board.white_pieces)
+    own_count = _popcount(pieces[player])
+    opp_count = _popcount(pieces[player ^ 1])
 
     piece_diff = own_count - opp_count
 
@@ -376,7 +399,7 @@ class EvaluationEngine:
 
     def evaluate_position(self, board: Board) -> EvaluationSummary:
         """Summarize current position from the bot's perspective."""
-        score = evaluate(board, 'white')  # Bot always plays white
+        score = evaluate(board, WHITE)  # Bot always plays white
         # Convert score to pseudo win probability via logistic function.
         scaled = max(min(score / self.logistic_scale, 60), -60)
         win_probability = 1.0 / (1.0 + math.exp(-scaled))
@@ -4,106 +4,228 @@ Implements negamax with alpha-beta pruning, move ordering, transposition tables,
 endgame perfect solver, and advanced move ordering heuristics.
 """
 
-from typing import Tuple, Optional, Dict, List
-from board import Board, get_legal_moves, make_move, pass_turn, is_game_over, CORNERS
-from evaluate import evaluate, evaluate_terminal
+import time
+from typing import Iterator, NamedTuple, Tuple, Optional, Dict, List
+from .board import Board, get_legal_moves_mask, iter_bits, make_move, pass_turn, CORNERS, X_SQUARES
+from .evaluate import evaluate, evaluate_terminal
 
 
-# Transposition table: maps board hash to (depth, score, best_move)
-TranspositionTable = Dict[int, Tuple[int, float, Optional[int]]]
+# Transposition table entry bound flags
+FLAG_EXACT = 0  # value is the exact score
+FLAG_LOWER = 1  # value is a lower bound (search failed high)
+FLAG_UPPER = 2  # value is an upper bound (search failed low)
 
-# Killer moves: moves that caused beta cutoffs at each depth
+# Unbounded search window limits
+NEG_INF = float('-inf')
+POS_INF = float('inf')
+
+# Depth recorded for endgame solver entries (searched to game end)
+ENDGAME_DEPTH = 9999
+
+# Transposition table slots (power of two), grouped into clusters of
+# TT_CLUSTER_SIZE; a hash maps to the cluster starting at hash & TT_INDEX_MASK
+TT_SIZE = 1 << 20
+TT_CLUSTER_SIZE = 4
+TT_INDEX_MASK = (TT_SIZE - 1) & ~(TT_CLUSTER_SIZE - 1)
+
+
+class TTEntry(NamedTuple):
+    """Transposition table entry."""
+
+    key: int
+    value: float
+    depth: int
+    flag: int
+    best_move: Optional[int]
+
+
+# Transposition table: fixed-size list of TTEntry slots probed a cluster at
+# a time. The full key is kept in each entry to tell apart the positions
+# sharing a cluster. Slots are never emptied, so a cluster fills front to
+# back and the first None ends a probe.
+TranspositionTable = List[Optional[TTEntry]]
+
+# The clock is checked once every (TIME_CHECK_MASK + 1) nodes
+TIME_CHECK_MASK = 0x3FF
+
+# Killer moves: moves that caused beta cutoffs at each depth, kept as two
+# slots [most recent, previous]; an unused slot holds NO_MOVE
 KillerMoves = Dict[int, List[int]]
+NO_MOVE = -1
 
 # History heuristic: tracks how often moves are good
 HistoryTable = Dict[int, int]
 
 
-def board_hash(board: Board) -> int:
-    """Create hash of board state for transposition table.
+class SearchLimit:
+    """Node counter and deadline shared by all nodes of one search.
+
+    Reading the clock costs more than a typical node, so tick() only polls
+    time.monotonic() once every TIME_CHECK_MASK + 1 nodes.
+    """
+
+    def __init__(self, deadline: float):
+        """Create a limit.
+
+        Args:
+            deadline: time.monotonic() value after which the search stops
+        """
+        self.deadline = deadline
+        self.nodes = 0
+
+    def tick(self) -> None:
+        """Count a node; raise TimeoutError once the deadline has passed."""
+        self.nodes += 1
+        if self.nodes & TIME_CHECK_MASK == 0 and time.monotonic() > self.deadline:
+            raise TimeoutError
+
+
+def bound_flag(score: float, alpha: float, beta: float) -> int:
+    """Classify a search result relative to the window it was searched with.
 
     Args:
-        board: Board state
+        score: Best score found
+        alpha: Alpha bound at node entry
+        beta: Beta bound
 
     Returns:
-        Integer hash combining piece positions and current player
+        FLAG_UPPER, FLAG_LOWER, or FLAG_EXACT
     """
-    # Simple hash: combine bitboards with player bit
-    player_bit = 1 if board.current_player == 'black' else 0
-    return (board.black_pieces << 65) | (board.white_pieces << 1) | player_bit
+    if score <= alpha:
+        return FLAG_UPPER
+    if score >= beta:
+        return FLAG_LOWER
+    return FLAG_EXACT
 
 
-def order_moves(
-    board: Board,
-    moves: list[int],
+def new_tt() -> TranspositionTable:
+    """Create an empty transposition table."""
+    return [None] * TT_SIZE
+
+
+def tt_clear(tt: TranspositionTable) -> None:
+    """Empty a transposition table in place."""
+    tt[:] = [None] * TT_SIZE
+
+
+def tt_probe(tt: TranspositionTable, h: int) -> Optional[TTEntry]:
+    """Return the entry stored for hash h, or None.
+
+    Args:
+        tt: Transposition table
+        h: Board hash
+
+    Returns:
+        Entry whose key is h, if its cluster holds one
+    """
+    base = h & TT_INDEX_MASK
+    for index in range(base, base + TT_CLUSTER_SIZE):
+        entry = tt[index]
+        if entry is None:
+            return None
+        if entry.key == h:
+            return entry
+    return None
+
+
+def tt_store(tt: TranspositionTable, entry: TTEntry) -> None:
+    """Store entry in its cluster unless a deeper result for the same position is there.
+
+    Uses a free slot if the cluster has one; otherwise replaces the least
+    valuable entry, ranked by depth + 2 for exact scores.
+
+    Args:
+        tt: Transposition table
+        entry: Entry to store (keyed by entry.key)
+    """
+    key = entry.key
+    base = key & TT_INDEX_MASK
+    victim = base
+    victim_worth = None
+    for index in range(base, base + TT_CLUSTER_SIZE):
+        old = tt[index]
+        if old is None:
+            victim = index
+            break
+        if old.key == key:
+            if old.depth > entry.depth:
+                return
+            victim = index
+            break
+        worth = old.depth + 2 * (old.flag == FLAG_EXACT)
+        if victim_worth is None or worth < victim_worth:
+            victim, victim_worth = index, worth
+    tt[victim] = entry
+
+
+def pick_moves(
+    legal_mask: int,
     pv_move: Optional[int] = None,
     killer_moves: Optional[List[int]] = None,
     history: Optional[HistoryTable] = None
-) -> list[int]:
-    """Order moves for better alpha-beta pruning.
+) -> Iterator[int]:
+    """Yield legal moves best-first for alpha-beta pruning, lazily.
 
     Priority (highest to lowest):
-    1. PV move (best move from previous iteration)
+    1. PV move (best move from previous iteration or the TT hash move)
     2. Corner moves
-    3. Killer moves (moves that caused cutoffs)
+    3. Killer moves (moves that caused cutoffs), most recent first
     4. Other moves sorted by history heuristic
     5. X-square moves (lowest priority)
 
+    Each tier is split off the legal-move mask only when the previous one
+    is exhausted, so a beta cutoff on an early move skips classifying and
+    sorting the rest.
+
     Args:
-        board: Current board state
-        moves: List of legal moves
-        pv_move: Principal variation move (best from previous search)
-        killer_moves: Moves that caused beta cutoffs at this depth
+        legal_mask: Bitboard of legal moves
+        pv_move: Principal variation / hash move
+        killer_moves: Killer slots for this depth
         history: History heuristic table
 
-    Returns:
-        Ordered list of moves
+    Yields:
+        Legal moves, best first
     """
-    if not moves:
-        return []
-
-    # Initialize history if not provided
-    if history is None:
-        history = {}
-
-    # Categorize moves
-    pv = []
-    corners = []
-    killers = []
-    regular = []
-    x_squares = []
-
-    for move in moves:
-        move_bit = 1 << move
-
-        # PV move gets highest priority
-        if pv_move is not None and move == pv_move:
-            pv.append(move)
-        # Corners are always good
-        elif move_bit & CORNERS:
-            corners.append(move)
-        # Killer moves get priority
-        elif killer_moves and move in killer_moves:
-            killers.append(move)
-        # X-squares are risky
-        elif move_bit & 0x0000420000004200:  # X-squares mask
-            x_squares.append(move)
+    remaining = legal_mask
+
+    # PV move gets highest priority
+    if pv_move is not None and remaining >> pv_move & 1:
+        yield pv_move
+        remaining ^= 1 << pv_move
+
+    # Corners are always good
+    corners = remaining & CORNERS
+    if corners:
+        remaining ^= corners
+        yield from iter_bits(corners)
+
+    # Killer moves get priority
+    if killer_moves:
+        for move in killer_moves:
+            if move >= 0 and remaining >> move & 1:
+                remaining ^= 1 << move
+                yield move
+
+    # Other moves sorted by history heuristic; X-squares are risky, so last
+    x_squares = remaining & X_SQUARES
+    regular = remaining ^ x_squares
+    if regular:
+        if history and regular & (regular - 1):
+            get_history = history.get
+            yield from sorted(iter_bits(regular), key=lambda m: get_history(m, 0), reverse=True)
         else:
-            regular.append(move)
-
-    # Sort regular moves by history heuristic (moves that worked well before)
-    regular.sort(key=lambda m: history.get(m, 0), reverse=True)
-
-    # Combine in priority order
-    return pv + corners + killers + regular + x_squares
+            yield from iter_bits(regular)
+    if x_squares:
+        yield from iter_bits(x_squares)
 
 
 def solve_endgame(
     board: Board,
     alpha: float,
     beta: float,
-    player: str,
-    tt: Optional[TranspositionTable] = None
+    player: int,
+    tt: Optional[TranspositionTable] = None,
+    limit: Optional[SearchLimit] = None
 ) -> Tuple[float, Optional[int]]:
     """Perfect endgame solver - searches to completion.
 
@@ -116,47 +238,72 @@ def solve_endgame(
         beta: Beta bound
         player: Player to maximize for
         tt: Transposition table
+        limit: Optional node counter/deadline; raises TimeoutError when exceeded
 
     Returns:
         Tuple of (exact_score, best_move)
     """
     if tt is None:
-        tt = {}
-
-    # Check transposition table
-    h = board_hash(board)
-    if h in tt:
-        stored_depth, stored_score, stored_move = tt[h]
-        # In endgame solver, we want exact scores, so always use TT entry
-        return stored_score, stored_move
-
-    # Game over - return exact terminal value
-    if is_game_over(board):
-        score = evaluate_terminal(board, player)
-        return score, None
+        tt = new_tt()
+    if limit is None:
+        limit = SearchLimit(POS_INF)
+    return _solve_endgame(board, alpha, beta, player, tt, limit)
 
-    # Get legal moves
-    moves = get_legal_moves(board)
 
-    # Must pass if no moves
-    if not moves:
+def _solve_endgame(
+    board: Board,
+    alpha: float,
+    beta: float,
+    player: int,
+    tt: TranspositionTable,
+    limit: SearchLimit
+) -> Tuple[float, Optional[int]]:
+    """Recursive body of solve_endgame; tt and limit are required."""
+    limit.tick()
+
+    # Check transposition table. Only solved entries count, and only as the
+    # bound they were stored as: exact hits return, bounds narrow the window
+    h = board.zobrist
+    entry = tt_probe(tt, h)
+    hash_move = None
+    if entry is not None:
+        if entry.depth >= ENDGAME_DEPTH:
+            if entry.flag == FLAG_EXACT:
+                return entry.value, entry.best_move
+            if entry.flag == FLAG_LOWER:
+                alpha = max(alpha, entry.value)
+            else:
+                beta = min(beta, entry.value)
+            if alpha >= beta:
+                return entry.value, entry.best_move
+        hash_move = entry.best_move
+
+    alpha_orig = alpha
+
+    # Get legal moves (computed once: also decides pass and game over)
+    legal_mask = get_legal_moves_mask(board)
+    opponent = player ^ 1
+
+    # Must pass if no moves; game over (exact terminal value) if the
+    # opponent cannot move either
+    if not legal_mask:
         passed_board = pass_turn(board)
-        opponent = 'white' if player == 'black' else 'black'
-        score, _ = solve_endgame(passed_board, -beta, -alpha, opponent, tt)
+        if not get_legal_moves_mask(passed_board):
+            score = evaluate_terminal(board, player)
+            return score, None
+        score, _ = _solve_endgame(passed_board, -beta, -alpha, opponent, tt, limit)
         return -score, None
 
-    # Order moves for better pruning
-    ordered_moves = order_moves(board, moves)
-
-    best_score = float('-inf')
-    best_move = ordered_moves[0]
+    best_score = NEG_INF
+    best_move: Optional[int] = None
 
-    for move in ordered_moves:
+    # Stored best move, corners, then the rest with X-squares last; killer
+    # and history ordering is not worth its bookkeeping this close to the end
+    for move in pick_moves(legal_mask, hash_move):
         new_board = make_move(board, move)
 
         # Recursively solve
-        opponent = 'white' if player == 'black' else 'black'
-        score, _ = solve_endgame(new_board, -beta, -alpha, opponent, tt)
+        score, _ = _solve_endgame(new_board, -beta, -alpha, opponent, tt, limit)
         score = -score
 
         if score > best_score:
@@ -169,8 +316,9 @@ def solve_endgame(
         if alpha >= beta:
             break
 
-    # Store in transposition table with infinite depth (exact)
-    tt[h] = (9999, best_score, best_move)
+    # Store in transposition table with infinite depth
+    flag = bound_flag(best_score, alpha_orig, beta)
+    tt_store(tt, TTEntry(h, best_score, ENDGAME_DEPTH, flag, best_move))
 
     return best_score, best_move
 
@@ -180,12 +328,14 @@ def negamax(
     depth: int,
     alpha: float,
     beta: float,
-    player: str,
+    player: int,
     tt: Optional[TranspositionTable] = None,
     killer_moves: Optional[KillerMoves] = None,
     history: Optional[HistoryTable] = None,
     pv_move: Optional[int] = None,
-    current_depth: int = 0
+    current_depth: int = 0,
+    limit: Optional[SearchLimit] = None,
+    empty_count: Optional[int] = None
 ) -> Tuple[float, Optional[int]]:
     """Negamax search with alpha-beta pruning, killer moves, and history heuristic.
 
@@ -201,7 +351,11 @@ def negamax(
         killer_moves: Killer move table (optional)
         history: History heuristic table (optional)
         pv_move: Principal variation move from previous iteration
+            (defaults to the TT best move for this position)
         current_depth: Current search depth (for killer moves)
+        limit: Optional node counter/deadline; raises TimeoutError when exceeded
+        empty_count: Empty squares on board (computed if omitted; passed
+            down the recursion, since each move fills exactly one square)
 
     Returns:
         Tuple of (score, best_move)
@@ -209,63 +363,94 @@ def negamax(
         best_move is None if no legal moves
     """
     if tt is None:
-        tt = {}
+        tt = new_tt()
     if killer_moves is None:
         killer_moves = {}
     if history is None:
         history = {}
+    if limit is None:
+        limit = SearchLimit(POS_INF)
+    if empty_count is None:
+        empty_count = 64 - (board.black_pieces | board.white_pieces).bit_count()
+    return _negamax(board, depth, alpha, beta, player, tt, killer_moves, history,
+                    pv_move, current_depth, limit, empty_count)
 
-    # Check if we should use endgame solver
-    occupied = board.black_pieces | board.white_pieces
-    empty_count = 64 - bin(occupied).count('1')
 
-    # Switch to perfect solver in endgame
+def _negamax(
+    board: Board,
+    depth: int,
+    alpha: float,
+    beta: float,
+    player: int,
+    tt: TranspositionTable,
+    killer_moves: KillerMoves,
+    history: HistoryTable,
+    pv_move: Optional[int],
+    current_depth: int,
+    limit: SearchLimit,
+    empty_count: int
+) -> Tuple[float, Optional[int]]:
+    """Recursive body of negamax; every table and counter is required."""
+    # Switch to perfect solver in endgame (it counts the node itself)
     if empty_count <= 15:
-        return solve_endgame(board, alpha, beta, player, tt)
+        return _solve_endgame(board, alpha, beta, player, tt, limit)
+
+    limit.tick()
+
+    # Check transposition table: exact hits return, bounds narrow the window
+    h = board.zobrist
+    entry = tt_probe(tt, h)
+    if entry is not None and entry.depth >= depth:
+        if entry.flag == FLAG_EXACT:
+            return entry.value, entry.best_move
+        if entry.flag == FLAG_LOWER:
+            alpha = max(alpha, entry.value)
+        else:
+            beta = min(beta, entry.value)
+        if alpha >= beta:
+            return entry.value, entry.best_move
+
+    # Hash move: even a too-shallow entry's best move is the best first guess
+    if pv_move is None and entry is not None:
+        pv_move = entry.best_move
 
-    # Check transposition table
-    h = board_hash(board)
-    if h in tt:
-        stored_depth, stored_score, stored_move = tt[h]
-        if stored_depth >= depth:
-            return stored_score, stored_move
+    # Flags are classified against the (possibly narrowed) window searched
+    alpha_orig = alpha
 
     # Terminal depth or game over
     if depth == 0:
         score = evaluate(board, player)
         return score, None
 
-    if is_game_over(board):
-        score = evaluate_terminal(board, player)
-        return score, None
+    # Get legal moves (computed once: also decides pass and game over)
+    legal_mask = get_legal_moves_mask(board)
+    opponent = player ^ 1
 
-    # Get legal moves
-    moves = get_legal_moves(board)
-
-    # Must pass if no moves
-    if not moves:
+    # Must pass if no moves; game over if the opponent cannot move either
+    if not legal_mask:
         passed_board = pass_turn(board)
-        opponent = 'white' if player == 'black' else 'black'
-        score, _ = negamax(passed_board, depth - 1, -beta, -alpha, opponent, tt,
-                          killer_moves, history, None, current_depth + 1)
+        if not get_legal_moves_mask(passed_board):
+            score = evaluate_terminal(board, player)
+            return score, None
+        score, _ = _negamax(passed_board, depth - 1, -beta, -alpha, opponent, tt,
+                           killer_moves, history, None, current_depth + 1, limit,
+                           empty_count)
         return -score, None
 
     # Get killer moves for this depth
-    depth_killers = killer_moves.get(current_depth, [])
-
-    # Order moves with advanced heuristics
-    ordered_moves = order_moves(board, moves, pv_move, depth_killers, history)
+    depth_killers = killer_moves.get(current_depth)
 
-    best_score = float('-inf')
-    best_move = ordered_moves[0]
+    best_score = NEG_INF
+    best_move: Optional[int] = None
 
-    for move in ordered_moves:
+    # Moves come best-first from a staged picker, generated only as needed
+    for move in pick_moves(legal_mask, pv_move, depth_killers, history):
         new_board = make_move(board, move)
 
         # Switch perspective for negamax
-        opponent = 'white' if player == 'black' else 'black'
-        score, _ = negamax(new_board, depth - 1, -beta, -alpha, opponent, tt,
-                          killer_moves, history, None, current_depth + 1)
+        score, _ = _negamax(new_board, depth - 1, -beta, -alpha, opponent, tt,
+                           killer_moves, history, None, current_depth + 1, limit,
+                           empty_count - 1)
         score = -score  # Negate for current player
 
         if score > best_score:
@@ -276,13 +461,12 @@ def negamax(
 
         # Beta cutoff - update killer moves and history
         if alpha >= beta:
-            # Store killer move
-            if current_depth not in killer_moves:
-                killer_moves[current_depth] = []
-            if move not in killer_moves[current_depth]:
-                killer_moves[current_depth].insert(0, move)
-                # Keep only top 2 killers per depth
-                killer_moves[current_depth] = killer_moves[current_depth][:2]
+            # Store killer move: shift the two slots unless already newest
+            if depth_killers is None:
+                killer_moves[current_depth] = [move, NO_MOVE]
+            elif move != depth_killers[0]:
+                depth_killers[1] = depth_killers[0]
+                depth_killers[0] = move
 
             # Update history heuristic
             history[move] = history.get(move, 0) + depth * depth
@@ -290,6 +474,63 @@ def negamax(
             break
 
     # Store in transposition table
-    tt[h] = (depth, best_score, best_move)
+    flag = bound_flag(best_score, alpha_orig, beta)
+    tt_store(tt, TTEntry(h, best_score, depth, flag, best_move))
+
+    return best_score, best_move
+
+
+# Scores beyond this magnitude are proven wins/losses (see evaluate_terminal)
+WIN_SCORE_THRESHOLD = 5000.0
+
+
+def iterative_deepen(
+    board: Board,
+    max_depth: int,
+    player: int,
+    time_limit: Optional[float] = None,
+    tt: Optional[TranspositionTable] = None
+) -> Tuple[float, Optional[int]]:
+    """Search depth 1, 2, ... max_depth, reusing search state between iterations.
+
+    Each iteration's best move is tried first at the next depth, and the
+    shallower searches leave hash moves in the TT and killer/history
+    scores for the deeper ones.
+
+    Args:
+        board: Current board state
+        max_depth: Deepest iteration to run
+        player: Player to maximize for
+        time_limit: Optional wall-clock budget in seconds; the iteration
+            running when it expires is discarded
+        tt: Transposition table to share (e.g. across engine moves)
+
+    Returns:
+        Tuple of (score, best_move) from the deepest completed iteration
+        best_move is None if no legal moves (or no iteration completed)
+    """
+    if tt is None:
+        tt = new_tt()
+    limit = None
+    if time_limit is not None:
+        limit = SearchLimit(time.monotonic() + time_limit)
+
+    killer_moves: KillerMoves = {}
+    history: HistoryTable = {}
+
+    best_score, best_move = 0.0, None
+    for depth in range(1, max_depth + 1):
+        try:
+            score, move = negamax(board, depth, NEG_INF, POS_INF, player,
+                                  tt, killer_moves, history, best_move, 0, limit)
+        except TimeoutError:
+            break
+        best_score, best_move = score, move
+
+        # A proven result will not change with more depth
+        if abs(score) > WIN_SCORE_THRESHOLD:
+            break
+        if limit is not None and time.monotonic() >= limit.deadline:
+            break
 
     return best_score, best_move
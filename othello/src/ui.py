@@ -4,6 +4,7 @@ Uses the rich library for colorful terminal output and animations.
 """
 
 import time
+from functools import lru_cache
 from typing import List, Optional, Set
 from rich.console import Console
 from rich.panel import Panel
@@ -12,7 +13,7 @@ from rich.text import Text
 from rich.live import Live
 from rich import box
 
-from board import Board
+from .board import Board
 
 
 console = Console()
@@ -26,9 +27,13 @@ LEGAL_MOVE_STYLE = "bold yellow on dim"
 BOARD_BORDER_STYLE = "cyan"
 
 
+@lru_cache(maxsize=None)
 def create_piece_display(piece: Optional[str], is_legal_move: bool = False, flip_frame: int = 0) -> Text:
     """Create a colored display for a piece or empty square.
 
+    Results are cached and shared between cells, so callers must not
+    modify the returned Text.
+
     Args:
         piece: 'black', 'white', or None for empty
         is_legal_move: Whether this square is a legal move
@@ -53,15 +58,40 @@ def create_piece_display(piece: Optional[str], is_legal_move: bool = False, flip
         return Text("   ", style=EMPTY_SQUARE_STYLE)
 
 
-def create_board_table(board: Board, legal_moves: Optional[List[int]] = None,
-                       flipping_squares: Optional[Set[int]] = None, flip_frame: int = 0) -> Table:
-    """Create a rich Table displaying the board.
+# Row labels, shared by every table
+ROW_LABELS = tuple(Text(str(row + 1), style="cyan bold") for row in range(8))
+
+
+def create_board_cells(board: Board, legal_moves: Optional[List[int]] = None) -> List[Text]:
+    """Create the 64 cell displays for a board, indexed by square.
 
     Args:
         board: Current board state
         legal_moves: Optional list of legal moves to highlight
-        flipping_squares: Set of squares that are currently flipping
-        flip_frame: Animation frame for flips
+
+    Returns:
+        List of (shared) Rich Text cells
+    """
+    legal_moves_set = set(legal_moves) if legal_moves else set()
+    black, white = board.black_pieces, board.white_pieces
+
+    cells = []
+    for sq in range(64):
+        if black >> sq & 1:
+            piece = 'black'
+        elif white >> sq & 1:
+            piece = 'white'
+        else:
+            piece = None
+        cells.append(create_piece_display(piece, is_legal_move=sq in legal_moves_set))
+    return cells
+
+
+def create_table_from_cells(cells: List[Text]) -> Table:
+    """Lay out 64 cell displays as a rich Table with coordinates.
+
+    Args:
+        cells: Cell displays indexed by square
 
     Returns:
         Rich Table object
@@ -74,31 +104,34 @@ def create_board_table(board: Board, legal_moves: Optional[List[int]] = None,
     for col in "ABCDEFGH":
         table.add_column(col, style="cyan bold", justify="center", width=3)
 
-    legal_moves_set = set(legal_moves) if legal_moves else set()
-    flipping_set = flipping_squares if flipping_squares else set()
-
     # Add rows
     for row in range(8):
-        row_cells = [Text(str(row + 1), style="cyan bold")]
-
-        for col in range(8):
-            sq = row * 8 + col
-            piece = board.get_piece_at(sq)
-            is_legal = sq in legal_moves_set
-            is_flipping = sq in flipping_set
-
-            cell = create_piece_display(
-                piece,
-                is_legal_move=is_legal,
-                flip_frame=flip_frame if is_flipping else 0
-            )
-            row_cells.append(cell)
-
-        table.add_row(*row_cells)
+        table.add_row(ROW_LABELS[row], *cells[row * 8:row * 8 + 8])
 
     return table
 
 
+def create_board_table(board: Board, legal_moves: Optional[List[int]] = None,
+                       flipping_squares: Optional[Set[int]] = None, flip_frame: int = 0) -> Table:
+    """Create a rich Table displaying the board.
+
+    Args:
+        board: Current board state
+        legal_moves: Optional list of legal moves to highlight
+        flipping_squares: Set of squares that are currently flipping
+        flip_frame: Animation frame for flips
+
+    Returns:
+        Rich Table object
+    """
+    cells = create_board_cells(board, legal_moves)
+    if flipping_squares and flip_frame:
+        flip_cell = create_piece_display(None, flip_frame=flip_frame)
+        for sq in flipping_squares:
+            cells[sq] = flip_cell
+    return create_table_from_cells(cells)
+
+
 def display_board(board: Board, legal_moves: Optional[List[int]] = None,
                   title: str = "Othello") -> None:
     """Display the board with colors.
@@ -137,10 +170,18 @@ def animate_flip(board_before: Board, board_after: Board, flipped_squares: Set[i
         frames: Number of animation frames
         frame_delay: Delay between frames in seconds
     """
+    # Cells of the unchanged squares are built once; each frame only swaps
+    # in the animation cell for the flipping squares
+    base_cells = create_board_cells(board_before, legal_moves)
+
     with Live(console=console, refresh_per_second=10) as live:
         # Show flipping animation
         for frame in range(1, frames + 1):
-            table = create_board_table(board_before, legal_moves, flipped_squares, frame)
+            cells = base_cells.copy()
+            flip_cell = create_piece_display(None, flip_frame=frame)
+            for sq in flipped_squares:
+                cells[sq] = flip_cell
+            table = create_table_from_cells(cells)
             panel = Panel(
                 table,
                 title="[bold cyan]Othello[/bold cyan]",
@@ -168,8 +209,8 @@ def display_score(board: Board) -> None:
     Args:
         board: Current board state
     """
-    black_count = bin(board.black_pieces).count('1')
-    white_count = bin(board.white_pieces).count('1')
+    black_count = board.black_pieces.bit_count()
+    white_count = board.white_pieces.bit_count()
 
     score_text = Text()
     score_text.append("Score: ", style="bold")
@@ -258,8 +299,8 @@ def display_game_over(board: Board, winner: Optional[str]) -> None:
     console.print(panel)
 
     # Display final score
-    black_count = bin(board.black_pieces).count('1')
-    white_count = bin(board.white_pieces).count('1')
+    black_count = board.black_pieces.bit_count()
+    white_count = board.white_pieces.bit_count()
 
     console.print()
     result_text = Text()
@@ -1,15 +1,18 @@
 """Tests for board.py - verifying move generation and game logic."""
 
 import sys
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+# Add project root to path so the src package is importable
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from board import (
+from src.board import (
     Board, get_legal_moves, make_move, pass_turn, is_game_over,
-    get_winner, board_to_string, A1, B1, B2, B3, B4, C1, C3, H1,
-    H2, H3, H4, H5, A8, H8, C4, C5, D3, D4, D5, E4, E5, E6, F4, F5
+    get_winner, get_flipped_squares, board_to_string, transform_board,
+    transform_square, untransform_square, SYMMETRY_COUNT, BLACK, WHITE,
+    A1, B1, B2, B3, B4, C1, C3, H1, H2, H3, H4, H5, A7, B7, C7, A8, H8, C4, C5, D3, D4, D5,
+    E4, E5, E6, F4, F5
 )
 
 
@@ -28,7 +31,7 @@ def test_initial_board():
     assert board.get_piece_at(H8) is None
 
     # Black moves first
-    assert board.current_player == 'black'
+    assert board.current_player == BLACK
 
     print("✓ Initial board setup correct")
 
@@ -68,7 +71,7 @@ def test_make_move_flips():
     assert new_board.get_piece_at(E5) == 'white'
 
     # Turn switched to white
-    assert new_board.current_player == 'white'
+    assert new_board.current_player == WHITE
 
     print("✓ Move flips pieces correctly")
 
@@ -79,7 +82,7 @@ def test_multiple_direction_flips():
     board = Board(
         black_pieces=(1 << E4) | (1 << D5) | (1 << E5),  # E4, D5, E5
         white_pieces=(1 << D4) | (1 << C4) | (1 << D3),  # D4, C4, D3
-        current_player='black'
+        current_player=BLACK
     )
 
     # Black plays C5 (should flip C4 horizontally and potentially D4 diagonally)
@@ -98,7 +101,7 @@ def test_no_legal_moves_pass():
     board = Board(
         black_pieces=0,
         white_pieces=(1 << D4) | (1 << E4),
-        current_player='black'
+        current_player=BLACK
     )
 
     moves = get_legal_moves(board)
@@ -113,7 +116,7 @@ def test_game_over_detection():
     board = Board(
         black_pieces=0xFFFFFFFF00000000,  # Top half
         white_pieces=0x00000000FFFFFFFF,  # Bottom half
-        current_player='black'
+        current_player=BLACK
     )
 
     assert is_game_over(board), "Game should be over when board is full"
@@ -127,7 +130,7 @@ def test_winner_determination():
     board = Board(
         black_pieces=0xFFFFFFFF00000000,  # 32 pieces
         white_pieces=0x0000000000FFFFFF,  # 24 pieces
-        current_player='black'
+        current_player=BLACK
     )
 
     winner = get_winner(board)
@@ -137,7 +140,7 @@ def test_winner_determination():
     board2 = Board(
         black_pieces=0x00000000000000FF,  # 8 pieces
         white_pieces=0xFFFFFFFFFFFFFF00,  # 56 pieces
-        current_player='black'
+        current_player=BLACK
     )
 
     winner2 = get_winner(board2)
@@ -147,7 +150,7 @@ def test_winner_determination():
     board3 = Board(
         black_pieces=0xFFFFFFFF00000000,  # 32 pieces
         white_pieces=0x00000000FFFFFFFF,  # 32 pieces
-        current_player='black'
+        current_player=BLACK
     )
 
     winner3 = get_winner(board3)
@@ -157,19 +160,42 @@ def test_winner_determination():
 
 
 def test_board_copy():
-    """Test that board.copy() creates independent copy."""
+    """Test that board.copy() is equal and boards cannot be mutated."""
     board = Board.initial()
     copy = board.copy()
 
-    # Modify copy
-    copy.black_pieces = 0
-    copy.current_player = 'white'
+    assert copy == board
+    assert copy.zobrist == board.zobrist
+
+    # Boards are immutable
+    try:
+        copy.black_pieces = 0
+    except FrozenInstanceError:
+        pass
+    else:
+        raise AssertionError("Board fields should be read-only")
 
-    # Original should be unchanged
     assert board.black_pieces != 0
-    assert board.current_player == 'black'
+    assert board.current_player == BLACK
+
+    print("✓ Board copy is equal and immutable")
+
+
+def test_zobrist_incremental():
+    """Test that incremental hash updates match a from-scratch hash."""
+    board = Board.initial()
 
-    print("✓ Board copy is independent")
+    for _ in range(20):
+        moves = get_legal_moves(board)
+        board = make_move(board, moves[-1]) if moves else pass_turn(board)
+        fresh = Board(board.black_pieces, board.white_pieces, board.current_player)
+        assert board.zobrist == fresh.zobrist
+
+    passed = pass_turn(board)
+    assert passed.zobrist != board.zobrist
+    assert pass_turn(passed).zobrist == board.zobrist
+
+    print("✓ Zobrist hash updates incrementally")
 
 
 def test_corner_moves():
@@ -178,7 +204,7 @@ def test_corner_moves():
     board = Board(
         black_pieces=(1 << C1) | (1 << C3),  # C1, C3
         white_pieces=(1 << B1) | (1 << B2),    # B1, B2
-        current_player='black'
+        current_player=BLACK
     )
 
     moves = get_legal_moves(board)
@@ -196,7 +222,7 @@ def test_corner_moves():
 def test_edge_chain_move_detected():
     """Regression test for moves like H1 that capture along long edges."""
 
-    def board_from_rows(rows, current_player='black'):
+    def board_from_rows(rows, current_player=BLACK):
         black = 0
         white = 0
         for r, row in enumerate(rows):
@@ -218,7 +244,7 @@ def test_edge_chain_move_detected():
         "........",
         "........",
     ]
-    board = board_from_rows(rows, 'black')
+    board = board_from_rows(rows, BLACK)
     moves = set(get_legal_moves(board))
     expected = {H1, B2, H2, B3, H3, B4, F4, H4, H5}
     assert moves == expected, f"Expected {expected}, got {moves}"
@@ -226,6 +252,41 @@ def test_edge_chain_move_detected():
     print("✓ Edge captures including H1 are detected")
 
 
+def test_flip_ending_on_edge():
+    """Regression test for flips bracketed by a piece on the A file."""
+    board = Board(
+        black_pieces=1 << B7,
+        white_pieces=1 << A7,
+        current_player=WHITE
+    )
+
+    assert get_flipped_squares(board, C7) == [B7]
+
+    new_board = make_move(board, C7)
+    assert new_board.get_piece_at(B7) == 'white'
+    assert new_board.get_piece_at(C7) == 'white'
+
+    print("✓ Flips ending on the board edge are applied")
+
+
+def test_symmetry_transforms():
+    """Test that board symmetries map legal moves consistently."""
+    board = Board.initial()
+    for _ in range(3):
+        board = make_move(board, get_legal_moves(board)[0])
+
+    moves = set(get_legal_moves(board))
+    for symmetry in range(SYMMETRY_COUNT):
+        transformed = transform_board(board, symmetry)
+        assert transformed.black_pieces.bit_count() == board.black_pieces.bit_count()
+        expected = {transform_square(m, symmetry) for m in moves}
+        assert set(get_legal_moves(transformed)) == expected, f"symmetry {symmetry}"
+        for m in moves:
+            assert untransform_square(transform_square(m, symmetry), symmetry) == m
+
+    print("✓ Board symmetries preserve legal moves")
+
+
 def test_board_to_string():
     """Test string representation of board."""
     board = Board.initial()
@@ -248,13 +309,13 @@ def test_full_game_sequence():
     moves = get_legal_moves(board)
     assert D3 in moves
     board = make_move(board, D3)
-    assert board.current_player == 'white'
+    assert board.current_player == WHITE
 
     # Move 2: White makes a move
     moves = get_legal_moves(board)
     assert len(moves) > 0
     board = make_move(board, moves[0])
-    assert board.current_player == 'black'
+    assert board.current_player == BLACK
 
     # Move 3: Black makes another move
     moves = get_legal_moves(board)
@@ -278,7 +339,10 @@ def run_all_tests():
         test_game_over_detection,
         test_winner_determination,
         test_board_copy,
+        test_zobrist_incremental,
         test_corner_moves,
+        test_flip_ending_on_edge,
+        test_symmetry_transforms,
         test_board_to_string,
         test_full_game_sequence,
     ]
@@ -3,13 +3,13 @@
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from board import Board
-from evaluate import EvaluationEngine
+from src.board import Board, BLACK
+from src.evaluate import EvaluationEngine, count_frontier_pieces, count_stable_pieces
 
 
-def make_board(black_indices, white_indices, current_player='black'):
+def make_board(black_indices, white_indices, current_player=BLACK):
     black = 0
     for idx in black_indices:
         black |= 1 << idx
@@ -50,3 +50,20 @@ def test_human_advantage_in_summary():
     assert summary.leader == 'human'
     assert summary.score < 0
     assert summary.win_probability < 0.5
+
+
+def test_frontier_does_not_wrap_across_files():
+    # H1 is boxed in by G1/G2/H2; the empty A2 is not one of its neighbours
+    black = 1 << 7
+    white = (1 << 6) | (1 << 14) | (1 << 15)
+    assert count_frontier_pieces(black, white) == 0
+    assert count_frontier_pieces(white, black) == 3
+
+
+
+def test_stability_flood_is_capped_at_ten_passes():
+    # A long chain off the H8 corner needs more than 10 passes to fill;
+    # the capped flood stops one piece short of the full 29
+    own = 0xfe027e06666c7820
+    assert count_stable_pieces(own, 0) == 28
+    assert count_stable_pieces(0, own) == 0
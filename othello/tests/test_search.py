@@ -0,0 +1,245 @@
+"""Tests for search.py - verifying move ordering and search results."""
+
+import random
+import sys
+from pathlib import Path
+
+# Add project root to path so the src package is importable
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.search import (
+    pick_moves, solve_endgame, negamax, iterative_deepen, new_tt, SearchLimit, tt_probe, tt_store, TTEntry,
+    FLAG_EXACT, FLAG_LOWER, FLAG_UPPER, TT_SIZE, TT_CLUSTER_SIZE, TT_INDEX_MASK,
+    TIME_CHECK_MASK, WIN_SCORE_THRESHOLD, NEG_INF, POS_INF
+)
+from src import search
+from src.engine import OthelloEngine
+from src.board import (
+    Board, get_legal_moves, make_move, pass_turn, is_game_over,
+    A1, D3, B6, G6, B7, G7
+)
+
+
+def squares_mask(*squares):
+    mask = 0
+    for square in squares:
+        mask |= 1 << square
+    return mask
+
+
+def test_pick_moves_x_squares_last():
+    """B7/G7 are X-squares and go last; B6/G6 are ordered with regular moves."""
+    legal_mask = squares_mask(A1, D3, B6, G6, B7, G7)
+    history = {G6: 50, B6: 20, D3: 10}
+
+    ordered = list(pick_moves(legal_mask, None, None, history))
+
+    assert ordered[0] == A1
+    assert ordered[1:4] == [G6, B6, D3]
+    assert set(ordered[4:]) == {B7, G7}
+    print("✓ X-squares ordered last, B6/G6 with regular moves")
+
+
+def cluster_keys(count, base=0x40):
+    """Distinct hashes that all map to the TT cluster starting at base."""
+    return [base + n * TT_SIZE for n in range(count)]
+
+
+def test_tt_same_key_keeps_deeper_entry():
+    """Storing a position again only replaces a shallower result."""
+    tt = new_tt()
+    key = cluster_keys(1)[0]
+
+    tt_store(tt, TTEntry(key, 1.0, 5, FLAG_EXACT, A1))
+    tt_store(tt, TTEntry(key, 2.0, 3, FLAG_EXACT, D3))
+    assert tt_probe(tt, key).value == 1.0
+
+    tt_store(tt, TTEntry(key, 3.0, 7, FLAG_LOWER, D3))
+    entry = tt_probe(tt, key)
+    assert (entry.value, entry.depth, entry.best_move) == (3.0, 7, D3)
+
+    # The position never takes a second slot of its cluster
+    assert tt[(key & TT_INDEX_MASK) + 1] is None
+    print("✓ TT keeps the deeper entry for the same position")
+
+
+def test_tt_full_cluster_evicts_lowest_worth():
+    """A full cluster replaces the entry with the lowest depth + 2 * exact."""
+    tt = new_tt()
+    a, b, c, d, e = cluster_keys(TT_CLUSTER_SIZE + 1)
+
+    tt_store(tt, TTEntry(a, 0.0, 5, FLAG_EXACT, None))  # worth 7
+    tt_store(tt, TTEntry(b, 0.0, 3, FLAG_LOWER, None))  # worth 3
+    tt_store(tt, TTEntry(c, 0.0, 2, FLAG_EXACT, None))  # worth 4
+    tt_store(tt, TTEntry(d, 0.0, 6, FLAG_UPPER, None))  # worth 6
+    tt_store(tt, TTEntry(e, 0.0, 1, FLAG_UPPER, None))
+
+    assert tt_probe(tt, b) is None
+    for key in (a, c, d, e):
+        assert tt_probe(tt, key).key == key
+    print("✓ TT evicts the lowest-worth entry from a full cluster")
+
+
+def test_tt_probe_missing_key_in_full_cluster():
+    """Probing a full cluster for a position it does not hold returns None."""
+    tt = new_tt()
+    keys = cluster_keys(TT_CLUSTER_SIZE + 1)
+    for depth, key in enumerate(keys[:-1], start=1):
+        tt_store(tt, TTEntry(key, 0.0, depth, FLAG_EXACT, None))
+
+    base = keys[0] & TT_INDEX_MASK
+    assert all(tt[base + i] is not None for i in range(TT_CLUSTER_SIZE))
+    assert tt_probe(tt, keys[-1]) is None
+    print("✓ TT probe misses a position absent from a full cluster")
+
+
+def play_to_empties(seed, empties):
+    """Play random moves from the start until `empties` squares remain."""
+    rng = random.Random(seed)
+    board = Board.initial()
+    while 64 - (board.black_pieces | board.white_pieces).bit_count() > empties:
+        if is_game_over(board):
+            return None
+        moves = get_legal_moves(board)
+        board = make_move(board, rng.choice(moves)) if moves else pass_turn(board)
+    return None if is_game_over(board) else board
+
+
+def test_endgame_tt_reuse_after_null_windows():
+    """Bounds stored by null-window solves must not be reused as exact scores."""
+    solved = 0
+    for seed in range(6):
+        board = play_to_empties(seed, 10)
+        if board is None:
+            continue
+        player = board.current_player
+
+        tt = new_tt()
+        for beta in (-20, -4, 0, 6, 30):
+            solve_endgame(board, beta - 1, beta, player, tt)
+        reused, _ = solve_endgame(board, NEG_INF, POS_INF, player, tt)
+        fresh, _ = solve_endgame(board, NEG_INF, POS_INF, player, new_tt())
+
+        assert reused == fresh, f"seed {seed}: {reused} != {fresh}"
+        solved += 1
+
+    assert solved > 0
+    print("✓ Endgame TT bounds reused correctly after null-window probes")
+
+
+def test_search_raises_past_deadline():
+    """An expired deadline aborts the recursion at the first clock poll."""
+    board = play_to_empties(0, 12)
+    limit = SearchLimit(0.0)
+
+    try:
+        negamax(board, 20, NEG_INF, POS_INF, board.current_player, limit=limit)
+    except TimeoutError:
+        pass
+    else:
+        assert False, "search ignored an expired deadline"
+
+    assert limit.nodes == TIME_CHECK_MASK + 1
+    print("✓ Search raises TimeoutError once the deadline has passed")
+
+
+def test_engine_falls_back_after_timeout():
+    """get_best_move still returns a legal move when the deadline cuts a search."""
+    # The endgame solve at depth 1 outlasts a zero budget: nothing completes
+    board = play_to_empties(0, 12)
+    engine = OthelloEngine()
+    move, _, depth = engine.get_best_move(board, time_limit_seconds=0.0)
+    assert move in get_legal_moves(board)
+    assert depth == 0
+    assert engine.nodes_searched == TIME_CHECK_MASK + 1
+
+    # A midgame search keeps the move of the last completed depth
+    board = play_to_empties(0, 40)
+    engine = OthelloEngine()
+    move, _, depth = engine.get_best_move(board, time_limit_seconds=0.3)
+    assert move in get_legal_moves(board)
+    assert depth >= 1
+    assert engine.nodes_searched > 0
+    print("✓ Engine falls back to the last completed depth on timeout")
+
+
+def test_iterative_deepen_matches_negamax():
+    """The deepest full-window iteration agrees with a plain negamax search."""
+    for seed in range(4):
+        board = play_to_empties(seed, 40)
+        player = board.current_player
+        for depth in (3, 4):
+            expected = negamax(board, depth, NEG_INF, POS_INF, player)
+            assert iterative_deepen(board, depth, player) == expected
+    print("✓ Iterative deepening matches negamax at max depth")
+
+
+def test_iterative_deepen_stops_on_proven_result():
+    """Once a win or loss is proven, deeper iterations are skipped."""
+    board = play_to_empties(0, 10)
+    depths = []
+
+    def counting_negamax(board, depth, *args, **kwargs):
+        depths.append(depth)
+        return negamax(board, depth, *args, **kwargs)
+
+    search.negamax = counting_negamax
+    try:
+        score, move = iterative_deepen(board, 5, board.current_player)
+    finally:
+        search.negamax = negamax
+
+    assert abs(score) > WIN_SCORE_THRESHOLD
+    assert move in get_legal_moves(board)
+    assert depths == [1]
+    print("✓ Iterative deepening stops on a proven result")
+
+
+def test_iterative_deepen_timeout_before_first_depth():
+    """With no iteration completed there is no move to report."""
+    # Depth 1 hands off to the endgame solver, which outlasts a zero budget
+    board = play_to_empties(0, 12)
+    assert iterative_deepen(board, 5, board.current_player, time_limit=0.0) == (0.0, None)
+    print("✓ Iterative deepening reports no move when time runs out at depth 1")
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    tests = [
+        test_pick_moves_x_squares_last,
+        test_tt_same_key_keeps_deeper_entry,
+        test_tt_full_cluster_evicts_lowest_worth,
+        test_tt_probe_missing_key_in_full_cluster,
+        test_endgame_tt_reuse_after_null_windows,
+        test_search_raises_past_deadline,
+        test_engine_falls_back_after_timeout,
+        test_iterative_deepen_matches_negamax,
+        test_iterative_deepen_stops_on_proven_result,
+        test_iterative_deepen_timeout_before_first_depth,
+    ]
+
+    print("Running search.py tests...\n")
+
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            print(f"✗ {test.__name__} FAILED: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ {test.__name__} ERROR: {e}")
+            failed += 1
+
+    print(f"\n{len(tests) - failed}/{len(tests)} tests passed")
+
+    if failed == 0:
+        print("All tests passed! ✓")
+        return 0
+    else:
+        print(f"{failed} tests failed")
+        return 1
+
+
+if __name__ == '__main__':
+    exit(run_all_tests())